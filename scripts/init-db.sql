@@ -62,6 +62,7 @@ CREATE TABLE IF NOT EXISTS pipeline_steps (
     pipeline_id UUID REFERENCES pipelines(id) ON DELETE CASCADE,
     step_name VARCHAR(100) NOT NULL,
     step_order INTEGER NOT NULL,
+    depends_on JSONB,
     status pipeline_status DEFAULT 'pending',
     started_at TIMESTAMP WITH TIME ZONE,
     completed_at TIMESTAMP WITH TIME ZONE,
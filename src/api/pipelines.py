@@ -9,6 +9,7 @@ import structlog
 
 from src.database import get_db
 from src.models import Pipeline, PipelineStep, Repository, User
+from src.scheduler import pipeline_scheduler, SchedulerFull
 from src.schemas import (
     PipelineCreate, PipelineResponse, PipelineStepResponse,
     PipelineUpdate, PipelineListResponse
@@ -60,6 +61,11 @@ async def list_pipelines(
     pipelines = query.offset(skip).limit(limit).all()
     return pipelines
 
+@router.get("/queue")
+async def get_queue_stats():
+    """Get run queue depth, concurrency and wait times"""
+    return pipeline_scheduler.stats()
+
 @router.get("/{pipeline_id}", response_model=PipelineResponse)
 async def get_pipeline(
     pipeline_id: UUID,
@@ -148,10 +154,32 @@ async def trigger_pipeline(
             detail="Pipeline not found"
         )
     
-    # Here you would integrate with your actual CI/CD system
-    # For now, we'll just update the status
-    pipeline.status = "running"
+    if pipeline.status == "running" or pipeline_scheduler.is_tracked(pipeline.id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Pipeline is already queued or running"
+        )
+    
+    # Push back on callers instead of overcommitting the workers
+    if pipeline_scheduler.is_full:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Pipeline queue is full",
+            headers={"Retry-After": str(pipeline_scheduler.poll_interval)}
+        )
+    
+    pipeline.status = "pending"
     db.commit()
     
-    logger.info("Pipeline triggered", pipeline_id=str(pipeline_id))
-    return {"message": "Pipeline triggered successfully", "pipeline_id": str(pipeline_id)}
+    try:
+        queued = pipeline_scheduler.submit(pipeline.id)
+    except SchedulerFull:
+        queued = False  # Stays pending until the scheduler sweep finds a free slot
+    
+    logger.info("Pipeline triggered", pipeline_id=str(pipeline_id), queued=queued)
+    return {
+        "message": "Pipeline triggered successfully",
+        "pipeline_id": str(pipeline_id),
+        "status": "queued" if queued else "pending",
+        "queue_depth": pipeline_scheduler.stats()["queue_depth"]
+    }
@@ -13,6 +13,7 @@ from src.database import get_db
 from src.models import Pipeline, Repository, User, PipelineStep
 from src.config import get_settings
 from src.schemas import PipelineCreate
+from src.scheduler import pipeline_scheduler, SchedulerFull
 
 logger = structlog.get_logger()
 router = APIRouter(prefix="/api/v1/webhooks", tags=["webhooks"])
@@ -34,6 +35,14 @@ def verify_gitlab_signature(payload: bytes, token: str, secret: str) -> bool:
     """Verify GitLab webhook token"""
     return hmac.compare_digest(token, secret)
 
+def enqueue_pipeline(pipeline: Pipeline) -> str:
+    """Hand a new pipeline to the scheduler, leaving it pending if the queue is full"""
+    try:
+        return "queued" if pipeline_scheduler.submit(pipeline.id) else "pending"
+    except SchedulerFull:
+        logger.warning("Pipeline queue full, leaving pipeline pending", pipeline_id=str(pipeline.id))
+        return "pending"
+
 @router.post("/github")
 async def github_webhook(
     request: Request,
@@ -131,13 +140,13 @@ async def handle_github_push(payload: dict, db: Session):
     db.commit()
     db.refresh(pipeline)
     
-    # Create pipeline steps
+    # Create pipeline steps; Test and Security Scan only need the build, so they run side by side
     steps = [
         {"name": "Checkout", "order": 1},
         {"name": "Build", "order": 2},
-        {"name": "Test", "order": 3},
-        {"name": "Security Scan", "order": 4},
-        {"name": "Deploy", "order": 5}
+        {"name": "Test", "order": 3, "depends_on": ["Build"]},
+        {"name": "Security Scan", "order": 4, "depends_on": ["Build"]},
+        {"name": "Deploy", "order": 5, "depends_on": ["Test", "Security Scan"]}
     ]
     
     for step in steps:
@@ -145,21 +154,22 @@ async def handle_github_push(payload: dict, db: Session):
             pipeline_id=pipeline.id,
             step_name=step["name"],
             step_order=step["order"],
+            depends_on=step.get("depends_on"),
             status="pending"
         )
         db.add(pipeline_step)
     
     db.commit()
     
-    # Here you would trigger your actual CI/CD system
-    # For now, we'll just log and return
+    queue_status = enqueue_pipeline(pipeline)
     logger.info("Pipeline created", pipeline_id=str(pipeline.id), commit=commit_hash[:8])
     
     return {
         "message": "Pipeline triggered",
         "pipeline_id": str(pipeline.id),
         "commit": commit_hash[:8],
-        "branch": branch
+        "branch": branch,
+        "status": queue_status
     }
 
 async def handle_gitlab_push(payload: dict, db: Session):
@@ -189,13 +199,15 @@ async def handle_gitlab_push(payload: dict, db: Session):
     db.commit()
     db.refresh(pipeline)
     
+    queue_status = enqueue_pipeline(pipeline)
     logger.info("GitLab pipeline created", pipeline_id=str(pipeline.id), commit=commit_hash[:8])
     
     return {
         "message": "Pipeline triggered",
         "pipeline_id": str(pipeline.id),
         "commit": commit_hash[:8],
-        "branch": branch
+        "branch": branch,
+        "status": queue_status
     }
 
 async def handle_github_pull_request(payload: dict, db: Session):
@@ -225,12 +237,14 @@ async def handle_github_pull_request(payload: dict, db: Session):
     db.commit()
     db.refresh(pipeline)
     
+    queue_status = enqueue_pipeline(pipeline)
     logger.info("PR pipeline created", pipeline_id=str(pipeline.id), pr=pr_number)
     
     return {
         "message": "PR pipeline triggered",
         "pipeline_id": str(pipeline.id),
-        "pr_number": pr_number
+        "pr_number": pr_number,
+        "status": queue_status
     }
 
 async def handle_gitlab_merge_request(payload: dict, db: Session):
@@ -260,10 +274,12 @@ async def handle_gitlab_merge_request(payload: dict, db: Session):
     db.commit()
     db.refresh(pipeline)
     
+    queue_status = enqueue_pipeline(pipeline)
     logger.info("MR pipeline created", pipeline_id=str(pipeline.id), mr=mr_iid)
     
     return {
         "message": "MR pipeline triggered",
         "pipeline_id": str(pipeline.id),
-        "mr_number": mr_iid
+        "mr_number": mr_iid,
+        "status": queue_status
     }
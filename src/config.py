@@ -1,10 +1,15 @@
 """
 Configuration management
 """
-from pydantic import BaseSettings, Field
+from pydantic import Field
 from typing import Optional
 import os
 
+try:
+    from pydantic_settings import BaseSettings
+except ImportError:  # pydantic v1
+    from pydantic import BaseSettings
+
 class Settings(BaseSettings):
     # Application settings
     app_name: str = Field(default="CI/CD Pipeline API", env="APP_NAME")
@@ -38,6 +43,9 @@ class Settings(BaseSettings):
     webhook_secret: Optional[str] = Field(default=None, env="WEBHOOK_SECRET")
     max_pipeline_duration: int = Field(default=3600, env="MAX_PIPELINE_DURATION")  # seconds
     max_concurrent_pipelines: int = Field(default=5, env="MAX_CONCURRENT_PIPELINES")
+    pipeline_queue_size: int = Field(default=100, env="PIPELINE_QUEUE_SIZE")
+    scheduler_poll_interval: int = Field(default=10, env="SCHEDULER_POLL_INTERVAL")  # seconds
+    parallel_steps: bool = Field(default=True, env="PARALLEL_STEPS")  # run independent steps concurrently
     
     # Monitoring settings
     prometheus_enabled: bool = Field(default=True, env="PROMETHEUS_ENABLED")
@@ -50,6 +58,7 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
         case_sensitive = False
+        extra = "ignore"
 
 # Global settings instance
 settings = Settings()
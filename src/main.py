@@ -2,6 +2,7 @@
 Main application entry point
 """
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -34,11 +35,28 @@ logger = structlog.get_logger()
 REQUEST_COUNT = Counter('app_requests_total', 'Total app requests', ['method', 'endpoint'])
 REQUEST_LATENCY = Histogram('app_request_duration_seconds', 'Request latency')
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the pipeline scheduler for the lifetime of the app"""
+    try:
+        from src.scheduler import pipeline_scheduler
+    except ImportError as e:
+        logger.warning("Pipeline scheduler unavailable", error=str(e))
+        yield
+        return
+    
+    await pipeline_scheduler.start()
+    try:
+        yield
+    finally:
+        await pipeline_scheduler.stop()
+
 # Create FastAPI app
 app = FastAPI(
     title="CI/CD Pipeline API",
     description="A sample API with CI/CD pipeline implementation",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -3,9 +3,8 @@ Database models using SQLAlchemy
 """
 from sqlalchemy import (
     Column, String, Boolean, DateTime, Integer, Text, 
-    ForeignKey, Enum, BigInteger, Numeric
+    ForeignKey, Enum, BigInteger, Numeric, JSON, Uuid
 )
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -14,19 +13,19 @@ import enum
 
 Base = declarative_base()
 
-class PipelineStatus(enum.Enum):
+class PipelineStatus(str, enum.Enum):
     PENDING = "pending"
     RUNNING = "running"
     SUCCESS = "success"
     FAILED = "failed"
     CANCELLED = "cancelled"
 
-class DeploymentEnvironment(enum.Enum):
+class DeploymentEnvironment(str, enum.Enum):
     DEVELOPMENT = "development"
     STAGING = "staging"
     PRODUCTION = "production"
 
-class UserRole(enum.Enum):
+class UserRole(str, enum.Enum):
     ADMIN = "admin"
     DEVELOPER = "developer"
     VIEWER = "viewer"
@@ -34,7 +33,7 @@ class UserRole(enum.Enum):
 class User(Base):
     __tablename__ = "users"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     username = Column(String(50), unique=True, nullable=False)
     email = Column(String(100), unique=True, nullable=False)
     password_hash = Column(String(255), nullable=False)
@@ -51,11 +50,11 @@ class User(Base):
 class Repository(Base):
     __tablename__ = "repositories"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), nullable=False)
     url = Column(String(500), nullable=False)
     branch = Column(String(100), default="main")
-    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    owner_id = Column(Uuid(as_uuid=True), ForeignKey("users.id"))
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -67,14 +66,14 @@ class Repository(Base):
 class Pipeline(Base):
     __tablename__ = "pipelines"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), nullable=False)
-    repository_id = Column(UUID(as_uuid=True), ForeignKey("repositories.id"))
+    repository_id = Column(Uuid(as_uuid=True), ForeignKey("repositories.id"))
     status = Column(Enum(PipelineStatus), default=PipelineStatus.PENDING)
     commit_hash = Column(String(40))
     commit_message = Column(Text)
     branch = Column(String(100))
-    triggered_by = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    triggered_by = Column(Uuid(as_uuid=True), ForeignKey("users.id"))
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
     duration_seconds = Column(Integer)
@@ -91,10 +90,11 @@ class Pipeline(Base):
 class PipelineStep(Base):
     __tablename__ = "pipeline_steps"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    pipeline_id = Column(UUID(as_uuid=True), ForeignKey("pipelines.id", ondelete="CASCADE"))
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    pipeline_id = Column(Uuid(as_uuid=True), ForeignKey("pipelines.id", ondelete="CASCADE"))
     step_name = Column(String(100), nullable=False)
     step_order = Column(Integer, nullable=False)
+    depends_on = Column(JSON)  # step names; NULL means "the previous step in step_order"
     status = Column(Enum(PipelineStatus), default=PipelineStatus.PENDING)
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
@@ -109,15 +109,15 @@ class PipelineStep(Base):
 class Deployment(Base):
     __tablename__ = "deployments"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    pipeline_id = Column(UUID(as_uuid=True), ForeignKey("pipelines.id"))
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    pipeline_id = Column(Uuid(as_uuid=True), ForeignKey("pipelines.id"))
     environment = Column(Enum(DeploymentEnvironment), nullable=False)
     version = Column(String(50))
     image_tag = Column(String(100))
     status = Column(Enum(PipelineStatus), default=PipelineStatus.PENDING)
-    deployed_by = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    deployed_by = Column(Uuid(as_uuid=True), ForeignKey("users.id"))
     deployed_at = Column(DateTime(timezone=True))
-    rollback_id = Column(UUID(as_uuid=True), ForeignKey("deployments.id"))
+    rollback_id = Column(Uuid(as_uuid=True), ForeignKey("deployments.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
@@ -127,8 +127,8 @@ class Deployment(Base):
 class Artifact(Base):
     __tablename__ = "artifacts"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    pipeline_id = Column(UUID(as_uuid=True), ForeignKey("pipelines.id"))
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    pipeline_id = Column(Uuid(as_uuid=True), ForeignKey("pipelines.id"))
     name = Column(String(200), nullable=False)
     type = Column(String(50), nullable=False)  # 'docker_image', 'test_report', etc.
     url = Column(String(500))
@@ -142,8 +142,8 @@ class Artifact(Base):
 class PipelineMetric(Base):
     __tablename__ = "pipeline_metrics"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    pipeline_id = Column(UUID(as_uuid=True), ForeignKey("pipelines.id"))
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    pipeline_id = Column(Uuid(as_uuid=True), ForeignKey("pipelines.id"))
     metric_name = Column(String(100), nullable=False)
     metric_value = Column(Numeric(10, 2))
     metric_unit = Column(String(20))
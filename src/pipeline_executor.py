@@ -18,12 +18,69 @@ from src.config import get_settings
 
 logger = structlog.get_logger()
 
+def resolve_step_dependencies(steps: List[PipelineStep]) -> Dict[PipelineStep, List[PipelineStep]]:
+    """
+    Map each step to the steps it depends on.
+
+    Steps without an explicit ``depends_on`` depend on the previous step in
+    ``step_order``, so pipelines that declare nothing keep running linearly.
+    Raises ValueError for unknown dependencies or dependency cycles.
+    """
+    ordered = sorted(steps, key=lambda s: s.step_order)
+    by_name = {}
+    for step in ordered:
+        by_name.setdefault(step.step_name.lower(), []).append(step)
+    
+    dependencies = {}
+    previous = None
+    for step in ordered:
+        if step.depends_on is None:
+            dependencies[step] = [previous] if previous is not None else []
+        else:
+            dependencies[step] = []
+            for name in step.depends_on:
+                matches = by_name.get(name.lower(), [])
+                if not matches:
+                    raise ValueError(f"Step '{step.step_name}' depends on unknown step '{name}'")
+                if len(matches) > 1:
+                    raise ValueError(f"Step '{step.step_name}' depends on ambiguous step name '{name}'")
+                dependencies[step].append(matches[0])
+        previous = step
+    
+    # Kahn's algorithm: anything left unvisited sits on a cycle
+    remaining = {step: len(deps) for step, deps in dependencies.items()}
+    dependents = {step: [] for step in ordered}
+    for step, deps in dependencies.items():
+        for dep in deps:
+            dependents[dep].append(step)
+    ready = [step for step, count in remaining.items() if count == 0]
+    while ready:
+        step = ready.pop()
+        del remaining[step]
+        for dependent in dependents[step]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+    if remaining:
+        names = ", ".join(sorted(step.step_name for step in remaining))
+        raise ValueError(f"Dependency cycle between steps: {names}")
+    
+    return dependencies
+
 class PipelineExecutor:
     """Pipeline execution engine"""
     
-    def __init__(self):
+    def __init__(self, docker_client: Optional[docker.DockerClient] = None):
         self.settings = get_settings()
-        self.docker_client = docker.from_env()
+        self.parallel_steps = self.settings.parallel_steps
+        self._docker_client = docker_client
+    
+    @property
+    def docker_client(self) -> docker.DockerClient:
+        """Docker client, connected on first use so importing the executor needs no daemon"""
+        if self._docker_client is None:
+            self._docker_client = docker.from_env()
+        return self._docker_client
     
     async def execute_pipeline(self, pipeline_id: str) -> bool:
         """Execute a complete pipeline"""
@@ -46,12 +103,15 @@ class PipelineExecutor:
                 PipelineStep.pipeline_id == pipeline_id
             ).order_by(PipelineStep.step_order).all()
             
-            success = True
-            for step in steps:
-                step_success = await self.execute_step(step, db)
-                if not step_success:
-                    success = False
-                    break
+            if self.parallel_steps:
+                success = await self.execute_steps_parallel(steps, db)
+            else:
+                success = True
+                for step in steps:
+                    step_success = await self.execute_step(step, db)
+                    if not step_success:
+                        success = False
+                        break
             
             # Update final pipeline status
             pipeline.status = "success" if success else "failed"
@@ -84,6 +144,38 @@ class PipelineExecutor:
         finally:
             db.close()
     
+    async def execute_steps_parallel(self, steps: List[PipelineStep], db: Session) -> bool:
+        """Run each step as soon as its dependencies succeed; the first failure cancels its siblings"""
+        dependencies = resolve_step_dependencies(steps)
+        waiting = sorted(steps, key=lambda s: s.step_order)
+        succeeded = set()
+        running: Dict[asyncio.Task, PipelineStep] = {}
+        success = True
+        
+        try:
+            while success and (waiting or running):
+                ready = [step for step in waiting
+                         if all(dep in succeeded for dep in dependencies[step])]
+                for step in ready:
+                    waiting.remove(step)
+                    running[asyncio.ensure_future(self.execute_step(step, db))] = step
+                
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = running.pop(task)
+                    if task.result():
+                        succeeded.add(step)
+                    else:
+                        success = False
+        finally:
+            # Fail fast: stop every sibling still in flight
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        
+        return success
+    
     async def execute_step(self, step: PipelineStep, db: Session) -> bool:
         """Execute a single pipeline step"""
         logger.info("Executing step", 
@@ -122,6 +214,16 @@ class PipelineExecutor:
             
             return success
             
+        except asyncio.CancelledError:
+            logger.warning("Step cancelled", 
+                          step_name=step.step_name, 
+                          pipeline_id=str(step.pipeline_id))
+            
+            step.status = "cancelled"
+            step.completed_at = datetime.utcnow()
+            db.commit()
+            raise
+            
         except Exception as e:
             logger.error("Step execution failed", 
                         step_name=step.step_name, 
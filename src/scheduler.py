@@ -0,0 +1,209 @@
+"""
+Bounded run queue feeding pipelines to the executor
+"""
+import asyncio
+import time
+import uuid
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Set
+
+import structlog
+from prometheus_client import Gauge, Histogram
+from sqlalchemy.orm import Session
+
+from src.config import get_settings
+from src.database import SessionLocal
+from src.models import Pipeline
+
+logger = structlog.get_logger()
+
+# Prometheus metrics
+QUEUE_DEPTH = Gauge('pipeline_queue_depth', 'Pipelines waiting for a worker slot')
+RUNNING_PIPELINES = Gauge('pipelines_running', 'Pipelines currently executing')
+QUEUE_WAIT = Histogram('pipeline_queue_wait_seconds', 'Time pipelines spend queued before starting')
+
+class SchedulerFull(Exception):
+    """Raised when the run queue is at capacity"""
+
+class PipelineScheduler:
+    """
+    In-process scheduler that runs at most ``max_concurrent`` pipelines at once.
+
+    Pipelines are handed over with ``submit``; the queue in front of the
+    workers is bounded, and anything that does not fit stays ``pending`` in
+    the database until the periodic sweep finds room for it.
+    """
+
+    def __init__(
+        self,
+        executor=None,
+        max_concurrent: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        session_factory: Optional[Callable[[], Session]] = SessionLocal,
+    ):
+        settings = get_settings()
+        self._executor = executor
+        self.max_concurrent = max_concurrent or settings.max_concurrent_pipelines
+        self.max_queue_size = max_queue_size or settings.pipeline_queue_size
+        self.poll_interval = poll_interval or settings.scheduler_poll_interval
+        self.session_factory = session_factory
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._enqueued_at: Dict[uuid.UUID, float] = {}
+        self._running: Set[uuid.UUID] = set()
+        self._recent_waits: Deque[float] = deque(maxlen=100)
+
+    @property
+    def executor(self):
+        """Executor used to run pipelines, defaulting to the global instance"""
+        if self._executor is None:
+            from src.pipeline_executor import pipeline_executor
+            self._executor = pipeline_executor
+        return self._executor
+
+    @property
+    def is_running(self) -> bool:
+        return self._queue is not None
+
+    @property
+    def is_full(self) -> bool:
+        return self.is_running and self._queue.full()
+
+    def is_tracked(self, pipeline_id: uuid.UUID) -> bool:
+        """Whether the pipeline is already queued or running here"""
+        return pipeline_id in self._enqueued_at or pipeline_id in self._running
+
+    async def start(self):
+        """Start the worker pool and the pending-pipeline sweep"""
+        if self.is_running:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.max_concurrent)]
+        if self.session_factory is not None:
+            self._tasks.append(asyncio.ensure_future(self._sweep()))
+
+        logger.info("Pipeline scheduler started",
+                   max_concurrent=self.max_concurrent,
+                   max_queue_size=self.max_queue_size)
+
+    async def stop(self):
+        """Stop accepting work and cancel the workers"""
+        if not self.is_running:
+            return
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        self._tasks = []
+        self._queue = None
+        self._enqueued_at.clear()
+        QUEUE_DEPTH.set(0)
+        logger.info("Pipeline scheduler stopped")
+
+    def submit(self, pipeline_id: uuid.UUID) -> bool:
+        """
+        Queue a pipeline for execution.
+
+        Returns False when the scheduler isn't running or already tracks the
+        pipeline, and raises SchedulerFull when the queue is at capacity.
+        """
+        if not self.is_running or self.is_tracked(pipeline_id):
+            return False
+
+        try:
+            self._queue.put_nowait(pipeline_id)
+        except asyncio.QueueFull:
+            raise SchedulerFull(f"Pipeline queue is full ({self.max_queue_size} waiting)")
+
+        self._enqueued_at[pipeline_id] = time.monotonic()
+        QUEUE_DEPTH.set(self._queue.qsize())
+        return True
+
+    def wake(self):
+        """Ask the sweep to look for pending pipelines right away"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def stats(self) -> dict:
+        """Queue depth, concurrency and wait-time figures"""
+        now = time.monotonic()
+        oldest = max((now - t for t in self._enqueued_at.values()), default=0.0)
+        recent = list(self._recent_waits)
+        return {
+            "queue_depth": self._queue.qsize() if self.is_running else 0,
+            "queue_capacity": self.max_queue_size,
+            "running": len(self._running),
+            "max_concurrent": self.max_concurrent,
+            "oldest_wait_seconds": round(oldest, 3),
+            "average_wait_seconds": round(sum(recent) / len(recent), 3) if recent else 0.0,
+        }
+
+    async def _worker(self):
+        """Pull pipelines off the queue and run them one at a time"""
+        while True:
+            pipeline_id = await self._queue.get()
+
+            wait = time.monotonic() - self._enqueued_at.pop(pipeline_id, time.monotonic())
+            QUEUE_WAIT.observe(wait)
+            QUEUE_DEPTH.set(self._queue.qsize())
+            self._recent_waits.append(wait)
+            self._running.add(pipeline_id)
+            RUNNING_PIPELINES.set(len(self._running))
+
+            try:
+                await self.executor.execute_pipeline(pipeline_id)
+            except Exception as e:
+                logger.error("Scheduled pipeline crashed",
+                            pipeline_id=str(pipeline_id),
+                            error=str(e))
+            finally:
+                self._running.discard(pipeline_id)
+                RUNNING_PIPELINES.set(len(self._running))
+                self._queue.task_done()
+                # A slot opened up; pull in any overflow that waited in the database
+                self.wake()
+
+    async def _sweep(self):
+        """Periodically move pending pipelines from the database into free queue slots"""
+        while True:
+            self._wakeup.clear()
+            free = self._queue.maxsize - self._queue.qsize()
+            if free > 0:
+                tracked = list(self._enqueued_at) + list(self._running)
+                try:
+                    pending = await asyncio.to_thread(self._load_pending, free, tracked)
+                except Exception as e:
+                    logger.warning("Could not load pending pipelines", error=str(e))
+                    pending = []
+
+                for pipeline_id in pending:
+                    try:
+                        self.submit(pipeline_id)
+                    except SchedulerFull:
+                        break
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _load_pending(self, limit: int, tracked: List[uuid.UUID]) -> List[uuid.UUID]:
+        """Oldest pending pipelines that aren't already queued or running"""
+        db = self.session_factory()
+        try:
+            query = db.query(Pipeline.id).filter(Pipeline.status == "pending")
+            if tracked:
+                query = query.filter(Pipeline.id.notin_(tracked))
+            rows = query.order_by(Pipeline.created_at).limit(limit).all()
+            return [row.id for row in rows]
+        finally:
+            db.close()
+
+# Global scheduler instance
+pipeline_scheduler = PipelineScheduler()
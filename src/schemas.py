@@ -92,6 +92,7 @@ class PipelineListResponse(BaseModel):
 class PipelineStepBase(BaseModel):
     step_name: str = Field(..., min_length=1, max_length=100)
     step_order: int = Field(..., ge=1)
+    depends_on: Optional[List[str]] = None
 
 class PipelineStepCreate(PipelineStepBase):
     pipeline_id: UUID
@@ -17,3 +17,47 @@ def sample_data():
         "test_message": "Hello, World!",
         "test_number": 42
     }
+
+@pytest.fixture
+def session_factory():
+    """Session factory bound to a fresh in-memory SQLite database with all models"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from src.models import Base
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+@pytest.fixture
+def sample_pipeline_factory(session_factory):
+    """Create pipelines (with a user and repository) in the SQLite test database"""
+    from src.models import User, Repository, Pipeline
+
+    db = session_factory()
+    user = User(username="runner", email="runner@example.com", password_hash="x")
+    db.add(user)
+    db.commit()
+    repository = Repository(name="test-repo", url="https://github.com/test/repo.git", owner_id=user.id)
+    db.add(repository)
+    db.commit()
+
+    def create(**fields):
+        fields.setdefault("name", "test-pipeline")
+        fields.setdefault("commit_hash", "abc123def456")
+        fields.setdefault("branch", "main")
+        pipeline = Pipeline(repository_id=repository.id, **fields)
+        db.add(pipeline)
+        db.commit()
+        db.refresh(pipeline)
+        return pipeline
+
+    yield create
+    db.close()
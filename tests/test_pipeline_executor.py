@@ -0,0 +1,95 @@
+"""
+Test pipeline executor step scheduling
+"""
+import asyncio
+import pytest
+
+from src.models import PipelineStep
+from src.pipeline_executor import PipelineExecutor, resolve_step_dependencies
+
+class FakeSession:
+    """Stand-in for a SQLAlchemy session; the scheduler only commits"""
+    def commit(self):
+        pass
+
+def make_steps():
+    """Checkout -> Build -> (Test, Security Scan) -> Deploy"""
+    return [
+        PipelineStep(step_name="Checkout", step_order=1),
+        PipelineStep(step_name="Build", step_order=2),
+        PipelineStep(step_name="Test", step_order=3, depends_on=["Build"]),
+        PipelineStep(step_name="Security Scan", step_order=4, depends_on=["build"]),
+        PipelineStep(step_name="Deploy", step_order=5, depends_on=["Test", "Security Scan"]),
+    ]
+
+def test_default_dependencies_are_linear():
+    """Steps without depends_on wait for the previous step"""
+    steps = [PipelineStep(step_name=name, step_order=i) for i, name in enumerate(["a", "b", "c"], 1)]
+    dependencies = resolve_step_dependencies(list(reversed(steps)))
+    assert dependencies[steps[0]] == []
+    assert dependencies[steps[1]] == [steps[0]]
+    assert dependencies[steps[2]] == [steps[1]]
+
+def test_unknown_and_cyclic_dependencies_rejected():
+    """Invalid graphs fail before anything runs"""
+    with pytest.raises(ValueError, match="unknown step"):
+        resolve_step_dependencies([PipelineStep(step_name="a", step_order=1, depends_on=["nope"])])
+
+    with pytest.raises(ValueError, match="cycle"):
+        resolve_step_dependencies([
+            PipelineStep(step_name="a", step_order=1, depends_on=["b"]),
+            PipelineStep(step_name="b", step_order=2, depends_on=["a"]),
+        ])
+
+@pytest.mark.asyncio
+async def test_independent_steps_run_concurrently():
+    """Test and Security Scan overlap once Build is done"""
+    executor = PipelineExecutor(docker_client=object())
+    active, peak, order = [], [], []
+
+    async def fake_handler(step, db):
+        active.append(step.step_name)
+        peak.append(len(active))
+        order.append(step.step_name)
+        await asyncio.sleep(0.05)
+        active.remove(step.step_name)
+        return True
+
+    for name in ("checkout", "build", "test", "security", "deploy"):
+        setattr(executor, f"execute_{name}_step", fake_handler)
+
+    steps = make_steps()
+    assert await executor.execute_steps_parallel(steps, FakeSession())
+    assert max(peak) == 2
+    assert order[:2] == ["Checkout", "Build"]
+    assert order[-1] == "Deploy"
+    assert all(step.status == "success" for step in steps)
+
+@pytest.mark.asyncio
+async def test_failure_cancels_running_siblings():
+    """A failing step cancels in-flight siblings and nothing downstream starts"""
+    executor = PipelineExecutor(docker_client=object())
+
+    async def ok(step, db):
+        return True
+
+    async def fail(step, db):
+        await asyncio.sleep(0.01)
+        return False
+
+    async def hang(step, db):
+        await asyncio.sleep(60)
+        return True
+
+    executor.execute_checkout_step = ok
+    executor.execute_build_step = ok
+    executor.execute_test_step = fail
+    executor.execute_security_step = hang
+    executor.execute_deploy_step = ok
+
+    steps = make_steps()
+    assert not await asyncio.wait_for(executor.execute_steps_parallel(steps, FakeSession()), 5)
+    statuses = {step.step_name: step.status for step in steps}
+    assert statuses["Test"] == "failed"
+    assert statuses["Security Scan"] == "cancelled"
+    assert statuses["Deploy"] is None
@@ -0,0 +1,103 @@
+"""
+Test the bounded pipeline run queue
+"""
+import asyncio
+import uuid
+import pytest
+
+from src.models import Pipeline
+from src.scheduler import PipelineScheduler, SchedulerFull
+
+class FakeExecutor:
+    """Records how many pipelines run at once"""
+    def __init__(self, duration=0.05):
+        self.duration = duration
+        self.active = 0
+        self.peak = 0
+        self.executed = []
+
+    async def execute_pipeline(self, pipeline_id):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.duration)
+        self.executed.append(pipeline_id)
+        self.active -= 1
+        return True
+
+async def wait_until(condition, timeout=5):
+    """Poll until condition() is true"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    """No more than max_concurrent pipelines execute together"""
+    executor = FakeExecutor()
+    scheduler = PipelineScheduler(executor, max_concurrent=2, max_queue_size=10, session_factory=None)
+    await scheduler.start()
+    try:
+        ids = [uuid.uuid4() for _ in range(6)]
+        for pipeline_id in ids:
+            assert scheduler.submit(pipeline_id)
+        await wait_until(lambda: len(executor.executed) == 6)
+        assert executor.peak == 2
+        assert sorted(executor.executed) == sorted(ids)
+        assert scheduler.stats()["queue_depth"] == 0
+    finally:
+        await scheduler.stop()
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure():
+    """Submissions beyond the queue capacity are refused"""
+    executor = FakeExecutor(duration=1)
+    scheduler = PipelineScheduler(executor, max_concurrent=1, max_queue_size=1, session_factory=None)
+    await scheduler.start()
+    try:
+        assert scheduler.submit(uuid.uuid4())
+        await wait_until(lambda: scheduler.stats()["running"] == 1)
+        assert scheduler.submit(uuid.uuid4())
+        assert scheduler.is_full
+        with pytest.raises(SchedulerFull):
+            scheduler.submit(uuid.uuid4())
+    finally:
+        await scheduler.stop()
+
+@pytest.mark.asyncio
+async def test_duplicate_submission_ignored():
+    """A pipeline already queued is not queued twice"""
+    scheduler = PipelineScheduler(FakeExecutor(duration=1), max_concurrent=1, max_queue_size=5, session_factory=None)
+    assert not scheduler.submit(uuid.uuid4())  # not started yet
+    await scheduler.start()
+    try:
+        pipeline_id = uuid.uuid4()
+        assert scheduler.submit(pipeline_id)
+        assert not scheduler.submit(pipeline_id)
+    finally:
+        await scheduler.stop()
+
+@pytest.mark.asyncio
+async def test_sweep_picks_up_pending_pipelines(session_factory, sample_pipeline_factory):
+    """Pending rows in the database are pulled into the queue"""
+    pending = [sample_pipeline_factory(status="pending").id for _ in range(3)]
+    sample_pipeline_factory(status="success")
+
+    class CompletingExecutor(FakeExecutor):
+        async def execute_pipeline(self, pipeline_id):
+            await super().execute_pipeline(pipeline_id)
+            db = session_factory()
+            db.query(Pipeline).filter(Pipeline.id == pipeline_id).update({"status": "success"})
+            db.commit()
+            db.close()
+
+    executor = CompletingExecutor()
+    scheduler = PipelineScheduler(executor, max_concurrent=2, max_queue_size=10,
+                                  poll_interval=60, session_factory=session_factory)
+    await scheduler.start()
+    try:
+        await wait_until(lambda: len(executor.executed) == 3)
+        assert sorted(executor.executed) == sorted(pending)
+    finally:
+        await scheduler.stop()